@@ -697,27 +697,25 @@ class metagraph(torch.nn.Module):
 
                 self.weights = self._process_weights_or_bonds(raw_weights_data, "weights")
         """
-        data_array = []
-        for item in data:
+        # Fill rows of a preallocated matrix in place instead of stacking a list of
+        # rows, which held two copies of the full n x n tensor at peak.
+        data_array = torch.zeros(
+            (len(data), len(self.neurons)),
+            dtype=torch.float32 if attribute == "weights" else torch.int64,
+        )
+        convert = (
+            bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_tensor
+            if attribute == "weights"
+            else bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_tensor
+        )
+        for i, item in enumerate(data):
             if len(item) == 0:
-                data_array.append(torch.zeros(len(self.neurons)))
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                if attribute == "weights":
-                    data_array.append(
-                        bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_tensor(
-                            len(self.neurons), list(uids), list(values)
-                        )
-                    )
-                else:
-                    data_array.append(
-                        bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_tensor(
-                            len(self.neurons), list(uids), list(values)
-                        )
-                    )
+                continue  # Rows without entries stay zero.
+            uids, values = zip(*item)
+            # TODO: Validate and test the conversion of uids and values to tensor
+            data_array[i] = convert(len(self.neurons), list(uids), list(values))
         tensor_param = (
-            torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
+            torch.nn.Parameter(data_array, requires_grad=False)
             if len(data_array)
             else torch.nn.Parameter()
         )
@@ -749,23 +747,22 @@ class metagraph(torch.nn.Module):
                     )
 
         """
-        data_array = []
         n_subnets = subtensor.get_total_subnets() or 0
         subnets = subtensor.get_subnets()
-        for item in data:
+        # Preallocated like in _process_weights_or_bonds to avoid stacking a row list.
+        data_array = torch.zeros((len(data), n_subnets), dtype=torch.float32)
+        convert = (
+            bittensor.utils.weight_utils.convert_root_weight_uids_and_vals_to_tensor
+        )
+        for i, item in enumerate(data):
             if len(item) == 0:
-                data_array.append(torch.zeros(n_subnets))
-            else:
-                uids, values = zip(*item)
-                # TODO: Validate and test the conversion of uids and values to tensor
-                data_array.append(
-                    bittensor.utils.weight_utils.convert_root_weight_uids_and_vals_to_tensor(
-                        n_subnets, list(uids), list(values), subnets
-                    )
-                )
+                continue  # Rows without entries stay zero.
+            uids, values = zip(*item)
+            # TODO: Validate and test the conversion of uids and values to tensor
+            data_array[i] = convert(n_subnets, list(uids), list(values), subnets)
 
         tensor_param = (
-            torch.nn.Parameter(torch.stack(data_array), requires_grad=False)
+            torch.nn.Parameter(data_array, requires_grad=False)
             if len(data_array)
             else torch.nn.Parameter()
         )
@@ -803,7 +800,6 @@ class metagraph(torch.nn.Module):
         state_dict = self.state_dict()
         state_dict["axons"] = self.axons
         torch.save(state_dict, graph_file)
-        state_dict = torch.load(graph_file)
         return self
 
     def load(self):
@@ -889,7 +885,6 @@ class metagraph(torch.nn.Module):
         self.validator_permit = torch.nn.Parameter(
             state_dict["validator_permit"], requires_grad=False
         )
-        self.uids = torch.nn.Parameter(state_dict["uids"], requires_grad=False)
         self.axons = state_dict["axons"]
         if "weights" in state_dict:
             self.weights = torch.nn.Parameter(
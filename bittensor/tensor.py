@@ -166,7 +166,9 @@ class Tensor(pydantic.BaseModel):
         shape = list(tensor.shape)
         if len(shape) == 0:
             shape = [0]
-        torch_numpy = tensor.cpu().detach().numpy().copy()
+        # msgpack_numpy packs contiguous arrays straight from their buffer (and copies
+        # non-contiguous ones itself), so the numpy view needs no extra copy here.
+        torch_numpy = tensor.detach().cpu().numpy()
         data_buffer = base64.b64encode(
             msgpack.packb(torch_numpy, default=msgpack_numpy.encode)
         ).decode("utf-8")
@@ -56,9 +56,9 @@ def normalize_max_weight(
         cumsum = torch.cumsum(estimation, 0)
 
         # Determine the index of cutoff
-        estimation_sum = torch.tensor(
-            [(len(values) - i - 1) * estimation[i] for i in range(len(values))]
-        )
+        estimation_sum = (
+            len(values) - 1 - torch.arange(len(values), device=values.device)
+        ) * estimation
         n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
 
         # Determine the cutoff based on the index
@@ -91,10 +91,13 @@ def convert_weight_uids_and_vals_to_tensor(
             Converted row weights.
     """
     row_weights = torch.zeros([n], dtype=torch.float32)
-    for uid_j, wij in list(zip(uids, weights)):
-        row_weights[uid_j] = float(
-            wij
-        )  # assumes max-upscaled values (w_max = U16_MAX).
+    # Scatter all pairs in a single indexed write rather than one write per uid.
+    # Indexed writes with repeated indices are undefined, so keep the last value
+    # per uid explicitly.
+    pairs = dict(zip(uids, weights))
+    row_weights[torch.tensor(list(pairs.keys()), dtype=torch.int64)] = torch.tensor(
+        list(pairs.values()), dtype=torch.float32
+    )  # assumes max-upscaled values (w_max = U16_MAX).
     row_sum = row_weights.sum()
     if row_sum > 0:
         row_weights /= row_sum  # normalize
@@ -150,8 +153,10 @@ def convert_bond_uids_and_vals_to_tensor(
             Converted row bonds.
     """
     row_bonds = torch.zeros([n], dtype=torch.int64)
-    for uid_j, bij in list(zip(uids, bonds)):
-        row_bonds[uid_j] = int(bij)
+    pairs = dict(zip(uids, bonds))  # Last value wins for repeated uids.
+    row_bonds[torch.tensor(list(pairs.keys()), dtype=torch.int64)] = torch.tensor(
+        list(pairs.values()), dtype=torch.int64
+    )
     return row_bonds
 
 
@@ -245,7 +250,9 @@ def process_weights_for_netuid(
     non_zero_weights = weights[non_zero_weight_idx]
     if non_zero_weights.numel() == 0 or metagraph.n < min_allowed_weights:
         bittensor.logging.warning("No non-zero weights returning all ones.")
-        final_weights = torch.ones((metagraph.n)).to(metagraph.n) / metagraph.n
+        final_weights = (
+            torch.ones((metagraph.n), device=metagraph.n.device) / metagraph.n
+        )
         bittensor.logging.debug("final_weights", final_weights)
         return torch.tensor(list(range(len(final_weights)))), final_weights
 
@@ -255,7 +262,7 @@ def process_weights_for_netuid(
         )
         # ( const ): Should this be torch.zeros( ( metagraph.n ) ) to reset everyone to build up weight?
         weights = (
-            torch.ones((metagraph.n)).to(metagraph.n) * 1e-5
+            torch.ones((metagraph.n), device=metagraph.n.device) * 1e-5
         )  # creating minimum even non-zero weights
         weights[non_zero_weight_idx] += non_zero_weights
         bittensor.logging.debug("final_weights", weights)
@@ -277,8 +284,9 @@ def process_weights_for_netuid(
     bittensor.logging.debug("lowest_quantile", lowest_quantile)
 
     # Exclude all weights below the allowed quantile.
-    non_zero_weight_uids = non_zero_weight_uids[lowest_quantile <= non_zero_weights]
-    non_zero_weights = non_zero_weights[lowest_quantile <= non_zero_weights]
+    keep = lowest_quantile <= non_zero_weights
+    non_zero_weight_uids = non_zero_weight_uids[keep]
+    non_zero_weights = non_zero_weights[keep]
     bittensor.logging.debug("non_zero_weight_uids", non_zero_weight_uids)
     bittensor.logging.debug("non_zero_weights", non_zero_weights)
 
@@ -125,6 +125,20 @@ def test_process_weights_or_bonds(mock_environment):
     # TODO: Add more checks to ensure the bonds have been processed correctly
 
 
+def test_process_weights_or_bonds_empty_rows_keep_dtype(mock_environment):
+    _, neurons = mock_environment
+    metagraph = bittensor.metagraph(1, sync=False)
+    metagraph.neurons = neurons
+    data = [[]] + [neuron.bonds for neuron in neurons[1:]]
+
+    weights = metagraph._process_weights_or_bonds(data=data, attribute="weights")
+    bonds = metagraph._process_weights_or_bonds(data=data, attribute="bonds")
+
+    assert weights.dtype == torch.float32
+    assert bonds.dtype == torch.int64
+    assert torch.equal(bonds[0], torch.zeros(len(neurons), dtype=torch.int64))
+
+
 # Mocking the bittensor.subtensor class for testing purposes
 @pytest.fixture
 def mock_subtensor():
@@ -133,6 +133,13 @@ def test_convert_weight_uids_and_vals_to_tensor_happy_path(
         ("edge_case_empty", 5, [], [], torch.zeros(5)),
         ("edge_case_single", 1, [0], [100], torch.tensor([1.0])),
         ("edge_case_all_zeros", 4, [0, 1, 2, 3], [0, 0, 0, 0], torch.zeros(4)),
+        (
+            "edge_case_repeated_uid_last_wins",
+            3,
+            [0, 2, 0],
+            [10, 50, 50],
+            torch.tensor([0.5, 0.0, 0.5]),
+        ),
     ],
 )
 def test_convert_weight_uids_and_vals_to_tensor_edge_cases(
@@ -284,6 +291,13 @@ def test_happy_path(test_id, n, uids, bonds, expected_output):
             [],
             torch.zeros(10, dtype=torch.int64),
         ),  # Empty uids and bonds
+        (
+            "edge-3",
+            3,
+            [1, 2, 1],
+            [5, 6, 7],
+            torch.tensor([0, 7, 6], dtype=torch.int64),
+        ),  # Repeated uid keeps the last bond
     ],
 )
 def test_edge_cases(test_id, n, uids, bonds, expected_output):